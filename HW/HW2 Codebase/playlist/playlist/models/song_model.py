@@ -11,6 +11,17 @@ logger = logging.getLogger(__name__)
 configure_logger(logger)
 
 
+# SQL statements are kept on a single line with single spaces so callers can compare them exactly
+_SQL_INSERT_SONG = "INSERT INTO songs (artist, title, year, genre, duration) VALUES (?, ?, ?, ?, ?)"
+_SQL_SELECT_SONG_ID = "SELECT id FROM songs WHERE id = ?"
+_SQL_DELETE_SONG = "DELETE FROM songs WHERE id = ?"
+_SQL_SELECT_BY_ID = "SELECT id, artist, title, year, genre, duration FROM songs WHERE id = ?"
+_SQL_SELECT_BY_COMPOUND_KEY = "SELECT id, artist, title, year, genre, duration FROM songs WHERE artist = ? AND title = ? AND year = ?"
+_SQL_SELECT_ALL = "SELECT id, artist, title, year, genre, duration, play_count FROM songs"
+_SQL_SELECT_ALL_BY_PLAY_COUNT = _SQL_SELECT_ALL + " ORDER BY play_count DESC"
+_SQL_UPDATE_PLAY_COUNT = "UPDATE songs SET play_count = play_count + 1 WHERE id = ?"
+
+
 @dataclass
 class Song:
     id: int
@@ -68,10 +79,7 @@ def create_song(artist: str, title: str, year: int, genre: str, duration: int) -
     try:
         with get_db_connection() as conn:
             cursor = conn.cursor()
-            cursor.execute("""
-                INSERT INTO songs (artist, title, year, genre, duration)
-                VALUES (?, ?, ?, ?, ?)
-            """, (artist, title, year, genre, duration))
+            cursor.execute(_SQL_INSERT_SONG, (artist, title, year, genre, duration))
             conn.commit()
 
             logger.info(f"Song successfully added: {artist} - {title} ({year})")
@@ -100,14 +108,14 @@ def delete_song(song_id: int) -> None:
             cursor = conn.cursor()
 
             # Check if the song exists before attempting deletion
-            cursor.execute("SELECT id FROM songs WHERE id = ?", (song_id,))
+            cursor.execute(_SQL_SELECT_SONG_ID, (song_id,))
             song = cursor.fetchone()
 
             if not song:
                 logger.warning(f"Attempted to delete non-existent song with ID {song_id}")
                 raise ValueError(f"Song with ID {song_id} not found")
 
-            cursor.execute("DELETE FROM songs WHERE id = ?", (song_id,))
+            cursor.execute(_SQL_DELETE_SONG, (song_id,))
             conn.commit()
 
             logger.info(f"Successfully deleted song with ID {song_id}")
@@ -134,11 +142,7 @@ def get_song_by_id(song_id: int) -> Song:
         with get_db_connection() as conn:
             cursor = conn.cursor()
             logger.info(f"Attempting to retrieve song with ID {song_id}")
-            cursor.execute("""
-                SELECT id, artist, title, year, genre, duration
-                FROM songs
-                WHERE id = ?
-            """, (song_id,))
+            cursor.execute(_SQL_SELECT_BY_ID, (song_id,))
             row = cursor.fetchone()
 
             if row:
@@ -172,11 +176,7 @@ def get_song_by_compound_key(artist: str, title: str, year: int) -> Song:
         with get_db_connection() as conn:
             cursor = conn.cursor()
             logger.info(f"Attempting to retrieve song with artist '{artist}', title '{title}', and year {year}")
-            cursor.execute("""
-                SELECT id, artist, title, year, genre, duration
-                FROM songs
-                WHERE artist = ? AND title = ? AND year = ?
-            """, (artist, title, year))
+            cursor.execute(_SQL_SELECT_BY_COMPOUND_KEY, (artist, title, year))
             row = cursor.fetchone()
 
             if row:
@@ -209,12 +209,7 @@ def get_all_songs(sort_by_play_count: bool = False) -> list[dict]:
             logger.info("Attempting to retrieve all songs from the catalog")
 
             # Determine the sort order based on the 'sort_by_play_count' flag
-            query = """
-                SELECT id, artist, title, year, genre, duration, play_count
-                FROM songs
-            """
-            if sort_by_play_count:
-                query += " ORDER BY play_count DESC"
+            query = _SQL_SELECT_ALL_BY_PLAY_COUNT if sort_by_play_count else _SQL_SELECT_ALL
 
             cursor.execute(query)
             rows = cursor.fetchall()
@@ -300,14 +295,14 @@ def update_play_count(song_id: int) -> None:
             logger.info(f"Attempting to update play count for song with ID {song_id}")
 
             # Ensure the song exists before updating
-            cursor.execute("SELECT id FROM songs WHERE id = ?", (song_id,))
+            cursor.execute(_SQL_SELECT_SONG_ID, (song_id,))
             row = cursor.fetchone()
             if not row:
                 logger.warning(f"Cannot update play count: Song with ID {song_id} not found.")
                 raise ValueError(f"Song with ID {song_id} not found")
 
             # Increment the play count
-            cursor.execute("UPDATE songs SET play_count = play_count + 1 WHERE id = ?", (song_id,))
+            cursor.execute(_SQL_UPDATE_PLAY_COUNT, (song_id,))
             conn.commit()
 
             logger.info(f"Play count incremented for song with ID: {song_id}")
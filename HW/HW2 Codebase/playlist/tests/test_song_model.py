@@ -1,6 +1,6 @@
-from contextlib import contextmanager
-import re
+from contextlib import nullcontext
 import sqlite3
+from unittest.mock import MagicMock, patch
 
 import pytest
 
@@ -21,27 +21,49 @@ from playlist.models.song_model import (
 #
 ######################################################
 
-def normalize_whitespace(sql_query: str) -> str:
-    return re.sub(r'\s+', ' ', sql_query).strip()
+# song_model issues its SQL as single-line, single-spaced strings, so queries are compared exactly
+EXPECTED_INSERT_SQL = "INSERT INTO songs (artist, title, year, genre, duration) VALUES (?, ?, ?, ?, ?)"
+EXPECTED_SELECT_ID_SQL = "SELECT id FROM songs WHERE id = ?"
+EXPECTED_DELETE_SQL = "DELETE FROM songs WHERE id = ?"
+EXPECTED_SELECT_BY_ID_SQL = "SELECT id, artist, title, year, genre, duration FROM songs WHERE id = ?"
+EXPECTED_SELECT_BY_COMPOUND_KEY_SQL = "SELECT id, artist, title, year, genre, duration FROM songs WHERE artist = ? AND title = ? AND year = ?"
+EXPECTED_SELECT_ALL_SQL = "SELECT id, artist, title, year, genre, duration, play_count FROM songs"
+EXPECTED_SELECT_ALL_BY_PLAY_COUNT_SQL = "SELECT id, artist, title, year, genre, duration, play_count FROM songs ORDER BY play_count DESC"
+EXPECTED_UPDATE_PLAY_COUNT_SQL = "UPDATE songs SET play_count = play_count + 1 WHERE id = ?"
+
+# Songs compare by value, so the expected results can be shared across tests
+SONG_1 = Song(1, "Artist Name", "Song Title", 2022, "Pop", 180)
+SONG_2 = Song(2, "Artist B", "Song B", 2021, "Pop", 180)
 
 # Mocking the database connection for tests
-@pytest.fixture
-def mock_cursor(mocker):
-    mock_conn = mocker.Mock()
-    mock_cursor = mocker.Mock()
+# Patched once per module; mock_cursor below gives each test a clean call history
+@pytest.fixture(scope="module", autouse=True)
+def _shared_db_mocks(request):
+    mock_conn = MagicMock(spec=sqlite3.Connection)
+    mock_cursor = MagicMock(spec=sqlite3.Cursor)
 
     # Mock the connection's cursor
-    mock_conn.cursor.return_value = mock_cursor
-    mock_cursor.fetchone.return_value = None  # Default return for queries
-    mock_cursor.fetchall.return_value = []
-    mock_cursor.commit.return_value = None
+    mock_conn.configure_mock(**{"cursor.return_value": mock_cursor, "commit.return_value": None})
+    mock_cursor.configure_mock(**{"fetchone.return_value": None, "fetchall.return_value": []})  # Default return for queries
 
     # Mock the get_db_connection context manager from sql_utils
-    @contextmanager
-    def mock_get_db_connection():
-        yield mock_conn  # Yield the mocked connection object
+    mock_conn.__enter__.return_value = mock_conn  # Enter the mocked connection object
+    mock_conn.__exit__.return_value = False  # Let exceptions raised in the block propagate
+
+    patcher = patch("playlist.models.song_model.get_db_connection", return_value=mock_conn)
+    patcher.start()
+    request.addfinalizer(patcher.stop)
+
+    return mock_conn, mock_cursor
+
+@pytest.fixture
+def mock_cursor(_shared_db_mocks):
+    """Clear the shared connection and cursor's calls and per-test overrides before each test."""
+    mock_conn, mock_cursor = _shared_db_mocks
 
-    mocker.patch("playlist.models.song_model.get_db_connection", mock_get_db_connection)
+    mock_conn.reset_mock()  # Keeps the cursor and context manager wiring
+    mock_cursor.reset_mock(return_value=True, side_effect=True)
+    mock_cursor.configure_mock(**{"fetchone.return_value": None, "fetchall.return_value": []})
 
     return mock_cursor  # Return the mock cursor so we can set expectations per test
 
@@ -59,19 +81,14 @@ def test_create_song(mock_cursor):
     """
     create_song(artist="Artist Name", title="Song Title", year=2022, genre="Pop", duration=180)
 
-    expected_query = normalize_whitespace("""
-        INSERT INTO songs (artist, title, year, genre, duration)
-        VALUES (?, ?, ?, ?, ?)
-    """)
-    actual_query = normalize_whitespace(mock_cursor.execute.call_args[0][0])
-
-    assert actual_query == expected_query, "The SQL query did not match the expected structure."
+    expected_query = EXPECTED_INSERT_SQL
+    actual_query = mock_cursor.execute.call_args[0][0]
 
     # Extract the arguments used in the SQL call (second element of call_args)
     actual_arguments = mock_cursor.execute.call_args[0][1]
     expected_arguments = ("Artist Name", "Song Title", 2022, "Pop", 180)
 
-    assert actual_arguments == expected_arguments, f"The SQL query arguments did not match. Expected {expected_arguments}, got {actual_arguments}."
+    assert (actual_query, actual_arguments) == (expected_query, expected_arguments), "The SQL query or its arguments did not match."
 
 
 def test_create_song_duplicate(mock_cursor):
@@ -85,26 +102,22 @@ def test_create_song_duplicate(mock_cursor):
         create_song(artist="Artist Name", title="Song Title", year=2022, genre="Pop", duration=180)
 
 
-def test_create_song_invalid_duration():
-    """Test error when trying to create a song with an invalid duration (e.g., negative duration)
+@pytest.mark.parametrize("kwargs, match", [
+    ({"duration": -180}, r"Invalid duration: -180 \(must be a positive integer\)."),
+    ({"duration": "invalid"}, r"Invalid duration: invalid \(must be a positive integer\)."),
+    ({"year": 1899}, r"Invalid year: 1899 \(must be an integer greater than or equal to 1900\)."),
+    ({"year": "invalid"}, r"Invalid year: invalid \(must be an integer greater than or equal to 1900\)."),
+])
+def test_create_song_invalid_input(kwargs, match):
+    """Test error when trying to create a song with an invalid duration or year
+    (e.g., negative duration, year less than 1900, or non-integer values).
 
     """
-    with pytest.raises(ValueError, match=r"Invalid duration: -180 \(must be a positive integer\)."):
-        create_song(artist="Artist Name", title="Song Title", year=2022, genre="Pop", duration=-180)
+    song_args = {"artist": "Artist Name", "title": "Song Title", "year": 2022, "genre": "Pop", "duration": 180}
+    song_args.update(kwargs)
 
-    with pytest.raises(ValueError, match=r"Invalid duration: invalid \(must be a positive integer\)."):
-        create_song(artist="Artist Name", title="Song Title", year=2022, genre="Pop", duration="invalid")
-
-
-def test_create_song_invalid_year():
-    """Test error when trying to create a song with an invalid year (e.g., less than 1900 or non-integer).
-
-    """
-    with pytest.raises(ValueError, match=r"Invalid year: 1899 \(must be an integer greater than or equal to 1900\)."):
-        create_song(artist="Artist Name", title="Song Title", year=1899, genre="Pop", duration=180)
-
-    with pytest.raises(ValueError, match=r"Invalid year: invalid \(must be an integer greater than or equal to 1900\)."):
-        create_song(artist="Artist Name", title="Song Title", year="invalid", genre="Pop", duration=180)
+    with pytest.raises(ValueError, match=match):
+        create_song(**song_args)
 
 
 def test_delete_song(mock_cursor):
@@ -117,25 +130,20 @@ def test_delete_song(mock_cursor):
 
     delete_song(1)
 
-    expected_select_sql = normalize_whitespace("SELECT id FROM songs WHERE id = ?")
-    expected_delete_sql = normalize_whitespace("DELETE FROM songs WHERE id = ?")
+    expected_select_sql = EXPECTED_SELECT_ID_SQL
+    expected_delete_sql = EXPECTED_DELETE_SQL
 
     # Access both calls to `execute()` using `call_args_list`
-    actual_select_sql = normalize_whitespace(mock_cursor.execute.call_args_list[0][0][0])
-    actual_delete_sql = normalize_whitespace(mock_cursor.execute.call_args_list[1][0][0])
-
-    assert actual_select_sql == expected_select_sql, "The SELECT query did not match the expected structure."
-    assert actual_delete_sql == expected_delete_sql, "The UPDATE query did not match the expected structure."
+    select_call, delete_call = mock_cursor.execute.call_args_list
+    actual_select_sql, actual_select_args = select_call.args
+    actual_delete_sql, actual_delete_args = delete_call.args
 
     # Ensure the correct arguments were used in both SQL queries
     expected_select_args = (1,)
     expected_delete_args = (1,)
 
-    actual_select_args = mock_cursor.execute.call_args_list[0][0][1]
-    actual_delete_args = mock_cursor.execute.call_args_list[1][0][1]
-
-    assert actual_select_args == expected_select_args, f"The SELECT query arguments did not match. Expected {expected_select_args}, got {actual_select_args}."
-    assert actual_delete_args == expected_delete_args, f"The UPDATE query arguments did not match. Expected {expected_delete_args}, got {actual_delete_args}."
+    assert (actual_select_sql, actual_select_args) == (expected_select_sql, expected_select_args), "The SELECT query or its arguments did not match."
+    assert (actual_delete_sql, actual_delete_args) == (expected_delete_sql, expected_delete_args), "The DELETE query or its arguments did not match."
 
 
 def test_delete_song_bad_id(mock_cursor):
@@ -164,19 +172,17 @@ def test_get_song_by_id(mock_cursor):
 
     result = get_song_by_id(1)
 
-    expected_result = Song(1, "Artist Name", "Song Title", 2022, "Pop", 180)
-
-    assert result == expected_result, f"Expected {expected_result}, got {result}"
+    expected_result = SONG_1
 
-    expected_query = normalize_whitespace("SELECT id, artist, title, year, genre, duration FROM songs WHERE id = ?")
-    actual_query = normalize_whitespace(mock_cursor.execute.call_args[0][0])
+    assert result == expected_result
 
-    assert actual_query == expected_query, "The SQL query did not match the expected structure."
+    expected_query = EXPECTED_SELECT_BY_ID_SQL
+    actual_query = mock_cursor.execute.call_args[0][0]
 
     actual_arguments = mock_cursor.execute.call_args[0][1]
     expected_arguments = (1,)
 
-    assert actual_arguments == expected_arguments, f"The SQL query arguments did not match. Expected {expected_arguments}, got {actual_arguments}."
+    assert (actual_query, actual_arguments) == (expected_query, expected_arguments), "The SQL query or its arguments did not match."
 
 
 def test_get_song_by_id_bad_id(mock_cursor):
@@ -197,19 +203,17 @@ def test_get_song_by_compound_key(mock_cursor):
 
     result = get_song_by_compound_key("Artist Name", "Song Title", 2022)
 
-    expected_result = Song(1, "Artist Name", "Song Title", 2022, "Pop", 180)
+    expected_result = SONG_1
 
-    assert result == expected_result, f"Expected {expected_result}, got {result}"
+    assert result == expected_result
 
-    expected_query = normalize_whitespace("SELECT id, artist, title, year, genre, duration FROM songs WHERE artist = ? AND title = ? AND year = ?")
-    actual_query = normalize_whitespace(mock_cursor.execute.call_args[0][0])
-
-    assert actual_query == expected_query, "The SQL query did not match the expected structure."
+    expected_query = EXPECTED_SELECT_BY_COMPOUND_KEY_SQL
+    actual_query = mock_cursor.execute.call_args[0][0]
 
     actual_arguments = mock_cursor.execute.call_args[0][1]
     expected_arguments = ("Artist Name", "Song Title", 2022)
 
-    assert actual_arguments == expected_arguments, f"The SQL query arguments did not match. Expected {expected_arguments}, got {actual_arguments}."
+    assert (actual_query, actual_arguments) == (expected_query, expected_arguments), "The SQL query or its arguments did not match."
 
 
 def test_get_song_by_compound_key_bad_id(mock_cursor):
@@ -240,13 +244,10 @@ def test_get_all_songs(mock_cursor):
         {"id": 3, "artist": "Artist C", "title": "Song C", "year": 2022, "genre": "Jazz", "duration": 200, "play_count": 5}
     ]
 
-    assert songs == expected_result, f"Expected {expected_result}, but got {songs}"
+    assert songs == expected_result
 
-    expected_query = normalize_whitespace("""
-        SELECT id, artist, title, year, genre, duration, play_count
-        FROM songs
-    """)
-    actual_query = normalize_whitespace(mock_cursor.execute.call_args[0][0])
+    expected_query = EXPECTED_SELECT_ALL_SQL
+    actual_query = mock_cursor.execute.call_args[0][0]
 
     assert actual_query == expected_query, "The SQL query did not match the expected structure."
 
@@ -259,12 +260,12 @@ def test_get_all_songs_empty_catalog(mock_cursor, caplog):
 
     result = get_all_songs()
 
-    assert result == [], f"Expected empty list, but got {result}"
+    assert result == []
 
     assert "The song catalog is empty." in caplog.text, "Expected warning about empty catalog not found in logs."
 
-    expected_query = normalize_whitespace("SELECT id, artist, title, year, genre, duration, play_count FROM songs")
-    actual_query = normalize_whitespace(mock_cursor.execute.call_args[0][0])
+    expected_query = EXPECTED_SELECT_ALL_SQL
+    actual_query = mock_cursor.execute.call_args[0][0]
 
     assert actual_query == expected_query, "The SQL query did not match the expected structure."
 
@@ -287,14 +288,10 @@ def test_get_all_songs_ordered_by_play_count(mock_cursor):
         {"id": 3, "artist": "Artist C", "title": "Song C", "year": 2022, "genre": "Jazz", "duration": 200, "play_count": 5}
     ]
 
-    assert songs == expected_result, f"Expected {expected_result}, but got {songs}"
+    assert songs == expected_result
 
-    expected_query = normalize_whitespace("""
-        SELECT id, artist, title, year, genre, duration, play_count
-        FROM songs
-        ORDER BY play_count DESC
-    """)
-    actual_query = normalize_whitespace(mock_cursor.execute.call_args[0][0])
+    expected_query = EXPECTED_SELECT_ALL_BY_PLAY_COUNT_SQL
+    actual_query = mock_cursor.execute.call_args[0][0]
 
     assert actual_query == expected_query, "The SQL query did not match the expected structure."
 
@@ -314,14 +311,14 @@ def test_get_random_song(mock_cursor, mocker):
 
     result = get_random_song()
 
-    expected_result = Song(2, "Artist B", "Song B", 2021, "Pop", 180)
-    assert result == expected_result, f"Expected {expected_result}, got {result}"
+    expected_result = SONG_2
+    assert result == expected_result
 
     # Ensure that the random number was called with the correct number of songs
     mock_random.assert_called_once_with(3)
 
-    expected_query = normalize_whitespace("SELECT id, artist, title, year, genre, duration, play_count FROM songs")
-    actual_query = normalize_whitespace(mock_cursor.execute.call_args[0][0])
+    expected_query = EXPECTED_SELECT_ALL_SQL
+    actual_query = mock_cursor.execute.call_args[0][0]
 
     assert actual_query == expected_query, "The SQL query did not match the expected structure."
 
@@ -340,8 +337,8 @@ def test_get_random_song_empty_catalog(mock_cursor, mocker):
     # Ensure that the random number was not called since there are no songs
     mock_random.assert_not_called()
 
-    expected_query = normalize_whitespace("SELECT id, artist, title, year, genre, duration, play_count FROM songs ")
-    actual_query = normalize_whitespace(mock_cursor.execute.call_args[0][0])
+    expected_query = EXPECTED_SELECT_ALL_SQL
+    actual_query = mock_cursor.execute.call_args[0][0]
 
     assert actual_query == expected_query, "The SQL query did not match the expected structure."
 
@@ -353,23 +350,19 @@ def test_get_random_song_empty_catalog(mock_cursor, mocker):
 ######################################################
 
 
-def test_update_play_count(mock_cursor):
-    """Test updating the play count of a song.
+@pytest.mark.parametrize("fetchone, expected_calls, raises, match", [
+    (True, [(EXPECTED_SELECT_ID_SQL, (1,)), (EXPECTED_UPDATE_PLAY_COUNT_SQL, (1,))], None, None),
+    (None, [(EXPECTED_SELECT_ID_SQL, (1,))], ValueError, "Song with ID 1 not found"),
+], ids=["existing_song", "bad_id"])
+def test_update_play_count(mock_cursor, fetchone, expected_calls, raises, match):
+    """Test updating the play count of a song, and the error when the song does not exist.
 
     """
-    mock_cursor.fetchone.return_value = True
-
-    song_id = 1
-    update_play_count(song_id)
+    mock_cursor.fetchone.return_value = fetchone
 
-    expected_query = normalize_whitespace("""
-        UPDATE songs SET play_count = play_count + 1 WHERE id = ?
-    """)
-    actual_query = normalize_whitespace(mock_cursor.execute.call_args_list[1][0][0])
-
-    assert actual_query == expected_query, "The SQL query did not match the expected structure."
+    with pytest.raises(raises, match=match) if raises else nullcontext():
+        update_play_count(1)
 
-    actual_arguments = mock_cursor.execute.call_args_list[1][0][1]
-    expected_arguments = (song_id,)
+    actual_calls = [call.args for call in mock_cursor.execute.call_args_list]
 
-    assert actual_arguments == expected_arguments, f"The SQL query arguments did not match. Expected {expected_arguments}, got {actual_arguments}."
\ No newline at end of file
+    assert actual_calls == expected_calls, "The SQL queries or their arguments did not match."
\ No newline at end of file